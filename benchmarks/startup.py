@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Startup benchmark: `python -X importtime` cost of each gitauto subcommand.
+
+Local subcommands run for real inside a throwaway repository; network
+subcommands only parse `--help`, which is enough to catch module-level
+imports. Each command runs RUNS times and the fastest run is kept, for the
+bare-interpreter baseline too, so timer noise doesn't swamp the deltas.
+Modules that site hooks import at startup are ignored. Exits non-zero if
+a local subcommand imports `requests` or its dependencies.
+"""
+import os
+import sys
+import tempfile
+import subprocess
+
+GITAUTO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "gitauto.py")
+
+LOCAL_COMMANDS = [
+    ["status"],
+    ["log"],
+    ["branch", "list"],
+    ["cache", "size"],
+]
+NETWORK_COMMANDS = [
+    ["create", "--help"],
+    ["delete", "--help"],
+    ["visibility", "--help"],
+    ["push", "--help"],
+    ["pull", "--help"],
+    ["clone", "--help"],
+    ["clone-all", "--help"],
+]
+NETWORK_MODULES = ("requests", "urllib3", "charset_normalizer", "chardet", "idna", "certifi")
+RUNS = int(os.environ.get("GITAUTO_BENCH_RUNS", "7"))
+
+def import_profile(args, cwd, env):
+    """Run python under -X importtime; return (total ms, imported top-level modules)."""
+    result = subprocess.run([sys.executable, "-X", "importtime", *args],
+                            cwd=cwd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    total_us = 0
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        modules.add(name.split(".")[0])
+        if not line.split("|")[2].startswith("  "):  # top-level import
+            total_us += int(cumulative)
+    return total_us / 1000, modules
+
+def best_profile(args, cwd, env, runs=RUNS):
+    """Fastest of several import_profile runs (the minimum is the least noisy estimate)."""
+    profiles = [import_profile(args, cwd, env) for _ in range(max(1, runs))]
+    return min(total for total, _ in profiles), set().union(*(modules for _, modules in profiles))
+
+def main():
+    with tempfile.TemporaryDirectory() as home:
+        repo = os.path.join(home, "repo")
+        env = dict(os.environ, HOME=home, GITAUTO_CACHE_DIR=os.path.join(home, "cache"),
+                   GIT_AUTHOR_NAME="bench", GIT_AUTHOR_EMAIL="bench@example.com",
+                   GIT_COMMITTER_NAME="bench", GIT_COMMITTER_EMAIL="bench@example.com")
+        subprocess.run(["git", "init", "--quiet", repo], check=True)
+        subprocess.run(["git", "-C", repo, "commit", "--quiet", "--allow-empty", "-m", "init"], check=True, env=env)
+
+        baseline_ms, baseline_modules = best_profile(["-c", "pass"], repo, env)
+        failed = False
+        print(f"{'subcommand':<22} {'imports':>10}  network stack  (best of {RUNS})")
+        for args in LOCAL_COMMANDS + NETWORK_COMMANDS:
+            total_ms, modules = best_profile([GITAUTO, *args], repo, env)
+            total_ms -= baseline_ms
+            network = sorted(modules.intersection(NETWORK_MODULES) - baseline_modules)
+            if args in LOCAL_COMMANDS and network:
+                failed = True
+            print(f"{' '.join(args):<22} {total_ms:>8.1f}ms  {', '.join(network) or '-'}")
+
+    if failed:
+        print("❌ A local subcommand imported the network stack!")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())